@@ -0,0 +1,140 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""C-level batch evaluator for deployments without pandas/numba.
+
+Walks a raw CSV buffer with memchr/strtol instead of per-line Python
+string work. Build in place with:
+
+    python setup.py build_ext --inplace
+
+itms_simulation picks the extension up automatically when present.
+"""
+from libc.string cimport memchr
+from libc.stdlib cimport strtol, strtod
+from libc.math cimport ceil
+
+import array
+from sys import intern
+
+cdef bint _ieq(const char* p, Py_ssize_t n, const char* lower_word, Py_ssize_t wlen):
+    # ASCII case-insensitive equality against a lowercase word.
+    cdef Py_ssize_t i
+    cdef char c
+    if n != wlen:
+        return False
+    for i in range(n):
+        c = p[i]
+        if 65 <= c <= 90:
+            c += 32
+        if c != lower_word[i]:
+            return False
+    return True
+
+cdef inline bint _is_space(char c):
+    return c == 32 or c == 9 or c == 13 or c == 11 or c == 12
+
+cdef Py_ssize_t _trim(const char* s, Py_ssize_t* start, Py_ssize_t end):
+    # Strip surrounding whitespace in place; returns the new end.
+    while start[0] < end and _is_space(s[start[0]]):
+        start[0] += 1
+    while end > start[0] and _is_space(s[end - 1]):
+        end -= 1
+    return end
+
+
+def evaluate_batch(bytes data, dict limits, long default_limit, long tolerance,
+                   long fine_rate, long red_fine):
+    """Evaluate a buffer of raw CSV event lines.
+
+    Returns per-violation columns (vehicle_ids, timestamps, locations,
+    flags, overs, fines) with flags matching itms_simulation's
+    SPEEDING_FLAG/RED_LIGHT_FLAG. Malformed lines are skipped with the
+    same rules as parse_event.
+    """
+    cdef const char* s = data
+    cdef Py_ssize_t n = len(data)
+    cdef Py_ssize_t pos = 0, line_end, i, fstart, fend, flen
+    cdef Py_ssize_t starts[6]
+    cdef Py_ssize_t ends[6]
+    cdef const char* hit
+    cdef char numbuf[64]
+    cdef char* endptr
+    cdef long speed, limit, over, fine
+    cdef double fspeed
+    cdef bint sig_red, act_pass
+    cdef int nfields
+
+    vids = []
+    timestamps = []
+    locations = []
+    flags = array.array("b")
+    overs = array.array("q")
+    fines = array.array("q")
+
+    while pos < n:
+        hit = <const char*>memchr(s + pos, 10, n - pos)
+        line_end = (hit - s) if hit != NULL else n
+
+        # Split into at most six comma-delimited fields; like parse_event,
+        # anything after the sixth field is ignored.
+        nfields = 0
+        fstart = pos
+        while nfields < 6:
+            if nfields == 5:
+                hit = <const char*>memchr(s + fstart, 44, line_end - fstart)
+                fend = (hit - s) if hit != NULL else line_end
+            else:
+                hit = <const char*>memchr(s + fstart, 44, line_end - fstart)
+                if hit == NULL:
+                    break
+                fend = hit - s
+            starts[nfields] = fstart
+            ends[nfields] = _trim(s, &starts[nfields], fend)
+            nfields += 1
+            fstart = fend + 1
+        pos = line_end + 1
+        if nfields < 6:
+            continue
+
+        # Speed: int first, ceil(float) fallback, skip on garbage.
+        fstart = starts[3]
+        flen = ends[3] - fstart
+        if flen == 0 or flen > 63:
+            continue
+        for i in range(flen):
+            numbuf[i] = s[fstart + i]
+        numbuf[flen] = 0
+        speed = strtol(numbuf, &endptr, 10)
+        if endptr[0] != 0 or endptr == numbuf:
+            fspeed = strtod(numbuf, &endptr)
+            if endptr[0] != 0 or endptr == numbuf:
+                continue
+            speed = <long>ceil(fspeed)
+
+        # surrogateescape matches the text-mode stdin paths, which pass
+        # stray non-UTF-8 bytes through instead of raising.
+        location = intern(data[starts[2]:ends[2]].decode("utf-8", "surrogateescape"))
+        limit = limits.get(location, default_limit)
+        sig_red = _ieq(s + starts[4], ends[4] - starts[4], b"red", 3)
+        act_pass = _ieq(s + starts[5], ends[5] - starts[5], b"pass", 4)
+
+        if speed > limit + tolerance or (sig_red and act_pass):
+            timestamp = data[starts[0]:ends[0]].decode("utf-8", "surrogateescape")
+            vehicle_id = intern(data[starts[1]:ends[1]].decode("utf-8", "surrogateescape"))
+            if speed > limit + tolerance:
+                over = speed - limit
+                fine = over * fine_rate
+                vids.append(vehicle_id)
+                timestamps.append(timestamp)
+                locations.append(location)
+                flags.append(1)
+                overs.append(over)
+                fines.append(fine)
+            if sig_red and act_pass:
+                vids.append(vehicle_id)
+                timestamps.append(timestamp)
+                locations.append(location)
+                flags.append(2)
+                overs.append(0)
+                fines.append(red_fine)
+
+    return vids, timestamps, locations, flags, overs, fines
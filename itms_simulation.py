@@ -1,8 +1,52 @@
+#!/usr/bin/env python3
+import array
+import itertools
+import math
+import os
+import platform
+import sys
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 
-DEFAULT_SPEED_LIMIT = 50  
-SPEED_TOLERANCE = 5  
-RED_LIGHT_FINE = 2000  
-SPEED_FINE_PER_KMPH = 100  
+# Under PyPy the tracing JIT makes the pure-Python loop the fast path, while
+# numpy/pandas/compiled extensions would run through slow cpyext emulation,
+# so the accelerators are skipped there: `pypy3 itms_simulation.py` runs the
+# interpreter path unmodified.
+_IS_PYPY = platform.python_implementation() == "PyPy"
+
+np = pd = pa = pac = njit = itms_core = None
+if not _IS_PYPY:
+    try:
+        import numpy as np
+        import pandas as pd
+    except ImportError:
+        # Vectorized path is optional; everything still works in pure Python.
+        pass
+
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pac
+    except ImportError:
+        # pyarrow's SIMD CSV reader is optional; pandas.read_csv is the fallback.
+        pass
+
+    try:
+        from numba import njit, prange
+    except ImportError:
+        # JIT kernel is optional on top of the vectorized path.
+        pass
+
+    try:
+        import itms_core
+    except ImportError:
+        # Compiled fallback evaluator (see itms_core.pyx); pure Python without it.
+        pass
+
+DEFAULT_SPEED_LIMIT = 50
+SPEED_TOLERANCE = 5
+RED_LIGHT_FINE = 2000
+SPEED_FINE_PER_KMPH = 100
 
 
 LOCATION_SPEED_LIMITS = {
@@ -12,93 +56,647 @@ LOCATION_SPEED_LIMITS = {
     "Highway_7": 100,
 }
 
+# Tolerance folded into the thresholds at import time, so the hot speeding
+# check is a single table lookup and compare; LOCATION_SPEED_LIMITS is still
+# consulted (rare branch) to compute the over-limit amount.
+LOCATION_SPEED_THRESHOLDS = {k: v + SPEED_TOLERANCE for k, v in LOCATION_SPEED_LIMITS.items()}
+DEFAULT_SPEED_THRESHOLD = DEFAULT_SPEED_LIMIT + SPEED_TOLERANCE
+
+EVENT_COLUMNS = ["timestamp", "vehicle_id", "location", "speed", "signal_state", "action"]
+
+# Bit flags used by the bulk evaluation to tag each event's violations.
+SPEEDING_FLAG = 1
+RED_LIGHT_FLAG = 2
+
+def _case_variants(word):
+    """Every case spelling of *word*, so a set membership test replaces a
+    per-row .upper() allocation."""
+    return frozenset(map("".join, itertools.product(*zip(word.lower(), word.upper()))))
+
+RED_TOKENS = _case_variants("RED")
+PASS_TOKENS = _case_variants("PASS")
+
+# Report line templates bound once and shared by both emitters, so the
+# format strings are parsed a single time and the two paths cannot drift.
+VEHICLE_HEADER_TMPL = "Vehicle: {vid}  | Total Fine: ₹{fine}  | Violations: {count}".format
+SPEEDING_LINE_TMPL = "  - {ts} | {loc} | SPEEDING by {over} km/h -> Fine ₹{fine} (speed {speed} > limit {limit})".format
+RED_LIGHT_LINE_TMPL = "  - {ts} | {loc} | RED_LIGHT -> Fine ₹{fine} (Passed on RED)".format
+VEHICLE_SUMMARY_TMPL = "  {vid}: Violations={count}, TotalFine=₹{fine}".format
+
+SAMPLE_INPUT = [
+    "2025-11-05T09:12:33,KA01AB1234,MG_Road_01,68,RED,PASS",
+    "2025-11-05T09:13:10,KA01CD5678,MG_Road_01,55,GREEN,PASS",
+    "2025-11-05T09:15:00,KA02EF9999,Outer_Ring_2,95,GREEN,PASS",
+    "2025-11-05T09:16:20,KA01AB1234,School_Zone_A,45,GREEN,PASS",
+]
+
 def parse_event(line):
-    parts = [p.strip() for p in line.strip().split(",")]
-    if len(parts) < 6:
+    # str.count scans at memchr speed; rejecting short lines here avoids
+    # allocating the split list and six stripped fields for them.
+    if line.count(",") < 5:
         return None
+    # No outer line.strip(): the per-field strips already cover the trailing
+    # newline, and trimming each field keeps parity with the bulk paths.
+    parts = [p.strip() for p in line.split(",")]
     timestamp, vehicle_id, location, speed_s, signal_state, action = parts[:6]
+    # Integer speeds: km/h values are whole numbers in practice, and ceiling
+    # at parse time keeps all downstream fine math in int registers.
     try:
-        speed = float(speed_s)
+        speed = int(speed_s)
     except ValueError:
-        return None
-    return {
-        "timestamp": timestamp,
-        "vehicle_id": vehicle_id,
-        "location": location,
-        "speed": speed,
-        "signal_state": signal_state.upper(),
-        "action": action.upper()
-    }
+        try:
+            speed = math.ceil(float(speed_s))
+        except ValueError:
+            return None
+    # Tuple instead of dict: no per-event key hashing, index access in the
+    # hot loop. vehicle_id/location are reused as dict keys on every event;
+    # interning makes the repeat lookups pointer comparisons.
+    return (timestamp, sys.intern(vehicle_id), sys.intern(location), speed,
+            signal_state in RED_TOKENS, action in PASS_TOKENS)
 
+@lru_cache(maxsize=256)
 def get_speed_limit(location):
     return LOCATION_SPEED_LIMITS.get(location, DEFAULT_SPEED_LIMIT)
 
 def evaluate_event(evt):
     violations = []
-    speed_limit = get_speed_limit(evt["location"])
-    if evt["speed"] > speed_limit + SPEED_TOLERANCE:
-        over = evt["speed"] - speed_limit
-        over_rounded = math.ceil(over)
+    _, _, location, speed, sig_red, act_pass = evt
+    if speed > LOCATION_SPEED_THRESHOLDS.get(location, DEFAULT_SPEED_THRESHOLD):
+        speed_limit = get_speed_limit(location)
+        over_rounded = speed - speed_limit
         fine = over_rounded * SPEED_FINE_PER_KMPH
-        violations.append(("SPEEDING", over_rounded, fine, f"speed {evt['speed']} > limit {speed_limit}"))
-    if evt["signal_state"] == "RED" and evt["action"] == "PASS":
+        violations.append(("SPEEDING", over_rounded, fine, f"speed {speed} > limit {speed_limit}"))
+    if sig_red and act_pass:
         violations.append(("RED_LIGHT", None, RED_LIGHT_FINE, "Passed on RED"))
     return violations
 
-def main():
-    vehicles = defaultdict(lambda: {"violations": [], "total_fine": 0})
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _evaluate_kernel(speeds, loc_codes, limits_table, sig_is_red, act_is_pass,
+                         out_over, out_fine, out_type):
+        for i in prange(speeds.shape[0]):
+            over = speeds[i] - limits_table[loc_codes[i]]
+            if over > SPEED_TOLERANCE:
+                out_over[i] = over
+                out_fine[i] += over * SPEED_FINE_PER_KMPH
+                out_type[i] |= SPEEDING_FLAG
+            if sig_is_red[i] and act_is_pass[i]:
+                out_fine[i] += RED_LIGHT_FINE
+                out_type[i] |= RED_LIGHT_FLAG
+
+    def _warm_up_kernel():
+        # Compile before the timed processing path so JIT cost is not
+        # attributed to event evaluation.
+        zi = np.zeros(1, dtype=np.int64)
+        zb = np.zeros(1, dtype=np.bool_)
+        _evaluate_kernel(zi, zi, np.full(1, DEFAULT_SPEED_LIMIT, dtype=np.int64),
+                         zb, zb, zi.copy(), zi.copy(), np.zeros(1, dtype=np.int8))
+else:
+    _evaluate_kernel = None
+
+def print_sample_input():
+    print("No input detected. Sample input (pipe these lines to the program):\n")
+    for s in SAMPLE_INPUT:
+        print(s)
+
+def print_report(veh_violations, veh_fines, overall_counts, total_fines, detail=True):
+    # Build the whole report in memory and write it once rather than paying
+    # a print() call (and potential flush) per line. Violation descriptions
+    # are formatted here, not in the detection loop: the speed is recovered
+    # as limit + over, so detection never builds a per-row f-string.
+    out = []
+    if detail:
+        out.append("=== Violations Report ===")
+        for vid, violations in veh_violations.items():
+            if not violations:
+                continue
+            out.append(VEHICLE_HEADER_TMPL(vid=vid, fine=veh_fines[vid], count=len(violations)))
+            for flag, over, fine, timestamp, location in violations:
+                if flag == SPEEDING_FLAG:
+                    limit = get_speed_limit(location)
+                    out.append(SPEEDING_LINE_TMPL(ts=timestamp, loc=location, over=over,
+                                                  fine=fine, speed=limit + over, limit=limit))
+                else:
+                    out.append(RED_LIGHT_LINE_TMPL(ts=timestamp, loc=location, fine=fine))
+            out.append("")
+
+    out.append("=== Dashboard ===")
+    out.append(f"Total vehicles with violations: {len(veh_violations)}")
+    out.append(f"Total fines collected: ₹{total_fines}")
+    for k, cnt in overall_counts.items():
+        out.append(f"  {k}: {cnt}")
+    out.append("\nPer-vehicle summary:")
+    for vid, violations in veh_violations.items():
+        out.append(VEHICLE_SUMMARY_TMPL(vid=vid, count=len(violations), fine=veh_fines[vid]))
+    sys.stdout.write("\n".join(out))
+    sys.stdout.write("\n")
+
+CSV_BLOCK_SIZE = 2 << 20  # bytes of raw CSV per streamed pyarrow batch
+CSV_CHUNK_ROWS = 65536    # rows per pandas chunk when pyarrow is absent
+
+def _splice_rows(df, repaired):
+    """Insert repaired rows into a batch at their original stream positions.
+
+    repaired holds (position, fields) pairs in stream order, where position
+    indexes the batch's rows before any insertion; equal positions keep
+    their relative order.
+    """
+    pieces = []
+    prev = 0
+    for pos, fields in repaired:
+        if pos > prev:
+            pieces.append(df.iloc[prev:pos])
+            prev = pos
+        pieces.append(pd.DataFrame([fields], columns=EVENT_COLUMNS))
+    pieces.append(df.iloc[prev:])
+    return pd.concat(pieces, ignore_index=True)
+
+def iter_event_batches():
+    """Yield DataFrames of raw event rows from stdin in bounded-size batches.
+
+    Prefers pyarrow's streaming CSV reader (SIMD delimiter scanning) and
+    falls back to chunked pandas.read_csv, so peak memory stays O(batch)
+    instead of O(input). All columns come back as strings; the caller applies
+    the same strip/float-coercion guards as parse_event.
+
+    Non-whitespace input whose rows are all rejected still yields one empty
+    frame, so the caller can tell "nothing usable" from "no input at all"
+    the way the per-line paths do with saw_data.
+    """
+    if pac is not None:
+        # Empty input is detected up front instead of via ArrowInvalid:
+        # open_csv parses the first block eagerly, so catching ArrowInvalid
+        # around it would also swallow real parse/decode errors and silently
+        # truncate the stream. Those must propagate.
+        if not sys.stdin.buffer.peek(1):
+            return
+        # parse_event truncates long rows to their first six fields; pyarrow
+        # can only skip or error on them, so the handler stashes each one
+        # with its physical row number and the loop below splices the first
+        # six fields back into the batch at the original stream position.
+        # Short rows are skipped for real, like parse_event rejects them.
+        invalid_buf = []  # (row number, first-six fields or None to drop)
+        saw_short_data = False
+
+        def _stash_invalid(row):
+            nonlocal saw_short_data
+            if row.actual_columns > 6:
+                fields = row.text.split(",")[:6]
+            else:
+                fields = None
+                if row.text and not row.text.isspace():
+                    saw_short_data = True
+            invalid_buf.append((row.number, fields))
+            return "skip"
+
+        # Columns are read as binary so a stray non-UTF-8 byte cannot abort
+        # the read; each batch is cast to string in one vectorized pass and
+        # only a batch that fails UTF-8 validation takes the per-field
+        # surrogateescape decode, matching the text-mode paths.
+        string_schema = pa.schema([(c, pa.string()) for c in EVENT_COLUMNS])
+        reader = pac.open_csv(
+            sys.stdin.buffer,
+            read_options=pac.ReadOptions(column_names=EVENT_COLUMNS,
+                                         block_size=CSV_BLOCK_SIZE),
+            # quote_char=False: parse_event splits on literal commas and
+            # keeps quote characters in the field, so quoting is disabled
+            # here too (a quoted embedded comma just makes a long row).
+            parse_options=pac.ParseOptions(
+                delimiter=",", quote_char=False,
+                invalid_row_handler=_stash_invalid),
+            convert_options=pac.ConvertOptions(
+                column_types={c: pa.binary() for c in EVENT_COLUMNS}),
+        )
+        stream_pos = 0  # physical rows accounted for by earlier batches
+        yielded = False
+        for batch in reader:
+            try:
+                df = batch.cast(string_schema).to_pandas()
+            except pa.ArrowInvalid:
+                df = pd.DataFrame({
+                    c: pd.Series([v.decode("utf-8", "surrogateescape")
+                                  for v in batch.column(c).to_pylist()],
+                                 dtype=object)
+                    for c in EVENT_COLUMNS})
+            if invalid_buf:
+                invalid_buf.sort(key=lambda item: item[0])
+                repaired = []
+                consumed = 0
+                for k, (number, fields) in enumerate(invalid_buf):
+                    # Each earlier invalid row in this batch shifts the
+                    # remaining physical numbers down by one batch slot.
+                    pos = number - 1 - stream_pos - k
+                    if pos > len(df):
+                        break
+                    consumed += 1
+                    if fields is not None:
+                        repaired.append((pos, fields))
+                del invalid_buf[:consumed]
+                stream_pos += consumed
+                if repaired:
+                    df = _splice_rows(df, repaired)
+            stream_pos += len(batch)
+            if len(df):
+                yielded = True
+                yield df
+        if any(fields is not None for _, fields in invalid_buf):
+            invalid_buf.sort(key=lambda item: item[0])
+            yielded = True
+            yield pd.DataFrame([fields for _, fields in invalid_buf
+                                if fields is not None], columns=EVENT_COLUMNS)
+        if not yielded and saw_short_data:
+            yield pd.DataFrame(columns=EVENT_COLUMNS)
+        return
+
+    # Whole lines are read as a single column and split here, because
+    # read_csv's own field handling cannot reproduce parse_event's rules:
+    # it pads short rows (which parse_event rejects) and skips long rows
+    # (which parse_event truncates to six fields).
+    try:
+        chunks = pd.read_csv(
+            sys.stdin.buffer,
+            header=None,
+            names=["raw"],
+            sep="\x01",  # never occurs in event data: one raw line per row
+            quoting=3,   # QUOTE_NONE, like parse_event's literal split
+            dtype=str,
+            # Keep a literal "NA" line literal instead of turning it to NaN.
+            keep_default_na=False,
+            # Same lenient decoding as text-mode stdin under the C locale.
+            encoding="utf-8",
+            encoding_errors="surrogateescape",
+            chunksize=CSV_CHUNK_ROWS,
+        )
+    except pd.errors.EmptyDataError:
+        return
+    yielded = False
+    saw_short_data = False
+    for chunk in chunks:
+        raw = chunk["raw"]
+        rows = raw[raw.str.count(",") >= 5]
+        if rows.empty:
+            if not yielded and not saw_short_data:
+                saw_short_data = bool((raw.str.strip() != "").any())
+            continue
+        df = rows.str.split(",", n=6, expand=True).iloc[:, :6]
+        df.columns = EVENT_COLUMNS
+        yielded = True
+        yield df
+    if not yielded and saw_short_data:
+        yield pd.DataFrame(columns=EVENT_COLUMNS)
+
+def evaluate_events_bulk(df):
+    """Evaluate one batch of raw events.
+
+    Returns per-violation entry columns (vehicle_id, timestamp, location,
+    speed, limit, over, kind, fine) in chronological order, plus the batch's
+    speeding count, red-light count and total fines.
+    """
+    # Equivalent of the per-field strip + len(parts) < 6 / float() guards in parse_event.
+    for col in EVENT_COLUMNS:
+        if col != "speed":
+            df[col] = df[col].str.strip().fillna("")
+    df["speed"] = pd.to_numeric(df["speed"], errors="coerce").astype(float)
+    # Only an unparseable speed disqualifies a row; empty string fields are
+    # kept, matching parse_event (an event with a blank action can still
+    # carry a speeding fine).
+    df = df.dropna(subset=["speed"])
+
+    speeds = np.ceil(df["speed"].to_numpy()).astype(np.int64)
+    # Locations become small int codes indexing a per-location limit table,
+    # so the hot loop touches only numeric arrays.
+    loc_codes, loc_uniques = pd.factorize(df["location"])
+    limits_table = np.array([get_speed_limit(loc) for loc in loc_uniques], dtype=np.int64)
+    sig_is_red = df["signal_state"].isin(RED_TOKENS).to_numpy()
+    act_is_pass = df["action"].isin(PASS_TOKENS).to_numpy()
+
+    n = len(df)
+    over = np.zeros(n, dtype=np.int64)
+    fines = np.zeros(n, dtype=np.int64)
+    vtype = np.zeros(n, dtype=np.int8)
+    if _evaluate_kernel is not None:
+        _evaluate_kernel(speeds, loc_codes, limits_table, sig_is_red, act_is_pass,
+                         over, fines, vtype)
+    else:
+        limits = limits_table[loc_codes]
+        speeding_mask = speeds > (limits_table + SPEED_TOLERANCE)[loc_codes]
+        red_mask = sig_is_red & act_is_pass
+        over[speeding_mask] = speeds[speeding_mask] - limits[speeding_mask]
+        fines += over * SPEED_FINE_PER_KMPH + np.where(red_mask, RED_LIGHT_FINE, 0)
+        vtype |= speeding_mask * SPEEDING_FLAG
+        vtype |= red_mask * RED_LIGHT_FLAG
+
+    # SoA layout for the report: one flat column per field, one entry per
+    # violation, instead of a dict-of-dicts-of-dicts keyed by vehicle.
+    sp_rows = np.flatnonzero(vtype & SPEEDING_FLAG)
+    rl_rows = np.flatnonzero(vtype & RED_LIGHT_FLAG)
+    entry_rows = np.concatenate([sp_rows, rl_rows])
+    entry_kinds = np.concatenate([
+        np.full(len(sp_rows), SPEEDING_FLAG, dtype=np.int8),
+        np.full(len(rl_rows), RED_LIGHT_FLAG, dtype=np.int8),
+    ])
+    # Chronological entry order, SPEEDING before RED_LIGHT within an event.
+    chrono = np.lexsort((entry_kinds, entry_rows))
+    entry_rows = entry_rows[chrono]
+    entry_kinds = entry_kinds[chrono]
+    entry_fines = np.where(entry_kinds == SPEEDING_FLAG,
+                           over[entry_rows] * SPEED_FINE_PER_KMPH, RED_LIGHT_FINE)
+
+    limits = limits_table[loc_codes]
+    entries = (
+        df["vehicle_id"].to_numpy()[entry_rows],
+        df["timestamp"].to_numpy()[entry_rows],
+        df["location"].to_numpy()[entry_rows],
+        speeds[entry_rows],
+        limits[entry_rows],
+        over[entry_rows],
+        entry_kinds,
+        entry_fines,
+    )
+    return entries, len(sp_rows), len(rl_rows), int(fines.sum())
+
+def main_vectorized(detail=True):
+    if _evaluate_kernel is not None:
+        _warm_up_kernel()
+
+    saw_data = False
+    # Numeric entry columns accumulate into packed array.array buffers
+    # (8 B per value, 1 B per kind flag) grown with frombytes per batch;
+    # only the string columns stay as per-batch object arrays.
+    vid_parts, ts_parts, loc_parts = [], [], []
+    speeds_col = array.array("q")
+    limits_col = array.array("q")
+    overs_col = array.array("q")
+    kinds_col = array.array("b")
+    fines_col = array.array("q")
+    n_speeding = n_red_light = 0
+    total_fines = 0
+    for df in iter_event_batches():
+        # Any yielded frame means stdin carried real data, even if no row
+        # survived the malformed-line guards.
+        saw_data = True
+        if df.empty:
+            continue
+        entries, sp_count, rl_count, batch_fines = evaluate_events_bulk(df)
+        n_speeding += sp_count
+        n_red_light += rl_count
+        total_fines += batch_fines
+        e_vids, e_ts, e_locs, e_speeds, e_limits, e_overs, e_kinds, e_fines = entries
+        if len(e_vids):
+            vid_parts.append(e_vids)
+            ts_parts.append(e_ts)
+            loc_parts.append(e_locs)
+            speeds_col.frombytes(e_speeds.tobytes())
+            limits_col.frombytes(e_limits.tobytes())
+            overs_col.frombytes(e_overs.tobytes())
+            kinds_col.frombytes(e_kinds.tobytes())
+            fines_col.frombytes(e_fines.tobytes())
+
+    if not saw_data:
+        print_sample_input()
+        return
+
+    if vid_parts:
+        vids = np.concatenate(vid_parts)
+        timestamps = np.concatenate(ts_parts)
+        locations = np.concatenate(loc_parts)
+    else:
+        vids = timestamps = locations = np.empty(0, dtype=object)
+    speeds = np.frombuffer(speeds_col, dtype=np.int64)
+    limits = np.frombuffer(limits_col, dtype=np.int64)
+    overs = np.frombuffer(overs_col, dtype=np.int64)
+    kinds = np.frombuffer(kinds_col, dtype=np.int8)
+    fines = np.frombuffer(fines_col, dtype=np.int64)
+
+    # Dashboard keys appear in the order the first violation of each type
+    # occurred, matching the per-event accumulation path.
+    overall_counts = defaultdict(int)
+    if len(kinds) and kinds[0] == RED_LIGHT_FLAG:
+        if n_red_light:
+            overall_counts["RED_LIGHT"] = n_red_light
+        if n_speeding:
+            overall_counts["SPEEDING"] = n_speeding
+    else:
+        if n_speeding:
+            overall_counts["SPEEDING"] = n_speeding
+        if n_red_light:
+            overall_counts["RED_LIGHT"] = n_red_light
+
+    # Vehicle codes assigned in first-violation order, so a stable sort
+    # groups entries per vehicle while preserving report ordering, and all
+    # per-vehicle tallies become C-loop bincounts over small int keys.
+    vid_codes, vid_uniques = pd.factorize(vids)
+    n_vehicles = len(vid_uniques)
+    violations_per_vehicle = np.bincount(vid_codes, minlength=n_vehicles)
+    fines_per_vehicle = np.bincount(vid_codes, weights=fines,
+                                    minlength=n_vehicles).astype(np.int64)
+    # Single buffered write for the whole report instead of print() per line.
+    out = []
+    if detail:
+        order = np.argsort(vid_codes, kind="stable")
+        timestamps = timestamps[order]
+        locations = locations[order]
+        speeds = speeds[order]
+        limits = limits[order]
+        overs = overs[order]
+        kinds = kinds[order]
+        fines = fines[order]
+
+        ends = np.cumsum(violations_per_vehicle)
+        starts = ends - violations_per_vehicle
+
+        out.append("=== Violations Report ===")
+        for k in range(n_vehicles):
+            out.append(VEHICLE_HEADER_TMPL(vid=vid_uniques[k], fine=fines_per_vehicle[k],
+                                           count=violations_per_vehicle[k]))
+            for j in range(starts[k], ends[k]):
+                if kinds[j] == SPEEDING_FLAG:
+                    out.append(SPEEDING_LINE_TMPL(ts=timestamps[j], loc=locations[j], over=overs[j],
+                                                  fine=fines[j], speed=speeds[j], limit=limits[j]))
+                else:
+                    out.append(RED_LIGHT_LINE_TMPL(ts=timestamps[j], loc=locations[j], fine=fines[j]))
+            out.append("")
+
+    out.append("=== Dashboard ===")
+    out.append(f"Total vehicles with violations: {n_vehicles}")
+    out.append(f"Total fines collected: ₹{total_fines}")
+    for k, cnt in overall_counts.items():
+        out.append(f"  {k}: {cnt}")
+    out.append("\nPer-vehicle summary:")
+    for vid, count, vehicle_fine in zip(vid_uniques, violations_per_vehicle, fines_per_vehicle):
+        out.append(VEHICLE_SUMMARY_TMPL(vid=vid, count=count, fine=vehicle_fine))
+    sys.stdout.write("\n".join(out))
+    sys.stdout.write("\n")
+
+def _merge_violations(entries, veh_violations, veh_fines, overall_counts):
+    """Fold one batch of per-violation columns into the report state.
+
+    Returns the batch's total fines. Violation rows are a tiny fraction of
+    events, so this Python loop stays off the hot path.
+    """
+    total = 0
+    vids, timestamps, locations, flags, overs, fines = entries
+    for vid, timestamp, location, flag, over, fine in zip(
+            vids, timestamps, locations, flags, overs, fines):
+        veh_violations[vid].append((flag, over, fine, timestamp, location))
+        veh_fines[vid] += fine
+        overall_counts["SPEEDING" if flag == SPEEDING_FLAG else "RED_LIGHT"] += 1
+        total += fine
+    return total
+
+def main_cython(detail=True):
+    # No pandas, but the compiled itms_core scanner is available: stream
+    # stdin in line-aligned blocks and let C code do the per-row work.
+    veh_violations = defaultdict(list)
+    veh_fines = defaultdict(int)
     overall_counts = defaultdict(int)
     total_fines = 0
-    input_lines = sys.stdin.read().strip().splitlines()
-    if not input_lines:
-        # Print sample usage and sample input
-        sample = [
-            "2025-11-05T09:12:33,KA01AB1234,MG_Road_01,68,RED,PASS",
-            "2025-11-05T09:13:10,KA01CD5678,MG_Road_01,55,GREEN,PASS",
-            "2025-11-05T09:15:00,KA02EF9999,Outer_Ring_2,95,GREEN,PASS",
-            "2025-11-05T09:16:20,KA01AB1234,School_Zone_A,45,GREEN,PASS",
-        ]
-        print("No input detected. Sample input (pipe these lines to the program):\n")
-        for s in sample:
-            print(s)
+    saw_data = False
+    read = sys.stdin.buffer.read
+    pending = b""
+    while True:
+        chunk = read(CSV_BLOCK_SIZE)
+        if chunk:
+            buf = pending + chunk
+            cut = buf.rfind(b"\n") + 1
+            if cut == 0:
+                pending = buf
+                continue
+            pending = buf[cut:]
+            buf = buf[:cut]
+        elif pending:
+            buf, pending = pending, b""
+        else:
+            break
+        if not saw_data and not buf.isspace():
+            saw_data = True
+        entries = itms_core.evaluate_batch(
+            buf, LOCATION_SPEED_LIMITS, DEFAULT_SPEED_LIMIT, SPEED_TOLERANCE,
+            SPEED_FINE_PER_KMPH, RED_LIGHT_FINE)
+        total_fines += _merge_violations(entries, veh_violations, veh_fines,
+                                         overall_counts)
+
+    if not saw_data:
+        print_sample_input()
         return
 
-    for line in input_lines:
-        evt = parse_event(line)
-        if not evt:
+    print_report(veh_violations, veh_fines, overall_counts, total_fines, detail)
+
+def _iter_line_chunks():
+    """Yield line-aligned text chunks of roughly CSV_BLOCK_SIZE characters."""
+    read = sys.stdin.read
+    tail = ""
+    while True:
+        block = read(CSV_BLOCK_SIZE)
+        if not block:
+            if tail:
+                yield tail
+            return
+        block = tail + block
+        cut = block.rfind("\n") + 1
+        if cut == 0:
+            tail = block
             continue
-        violations = evaluate_event(evt)
-        if violations:
-            for vtype, over, fine, desc in violations:
-                vehicles[evt["vehicle_id"]]["violations"].append({
-                    "type": vtype, "over": over, "fine": fine, "desc": desc, "timestamp": evt["timestamp"], "location": evt["location"]
-                })
-                vehicles[evt["vehicle_id"]]["total_fine"] += fine
-                overall_counts[vtype] += 1
-                total_fines += fine
-
-    # Print violations per vehicle
-    print("=== Violations Report ===")
-    for vid, data in vehicles.items():
-        if not data["violations"]:
+        yield block[:cut]
+        tail = block[cut:]
+
+def _scan_lines(chunk):
+    """Evaluate one chunk of event lines; returns per-violation columns.
+
+    Detection from evaluate_event is inlined here with the fine constants
+    hoisted into locals: the per-event function frames and global lookups
+    cost more than the checks themselves. Events are independent, so this
+    also serves as the worker for the process pool in main_python.
+    """
+    vids = []
+    timestamps = []
+    locations = []
+    flags = array.array("b")
+    overs = array.array("q")
+    fines = array.array("q")
+    _parse = parse_event
+    _get_threshold = LOCATION_SPEED_THRESHOLDS.get
+    _default_threshold = DEFAULT_SPEED_THRESHOLD
+    _get_limit = LOCATION_SPEED_LIMITS.get
+    _default_limit = DEFAULT_SPEED_LIMIT
+    _fine_rate = SPEED_FINE_PER_KMPH
+    for line in chunk.splitlines():
+        evt = _parse(line)
+        if not evt:
             continue
-        print(f"Vehicle: {vid}  | Total Fine: ₹{data['total_fine']}  | Violations: {len(data['violations'])}")
-        for v in data["violations"]:
-            if v["type"] == "SPEEDING":
-                print(f"  - {v['timestamp']} | {v['location']} | SPEEDING by {v['over']} km/h -> Fine ₹{v['fine']} ({v['desc']})")
-            else:
-                print(f"  - {v['timestamp']} | {v['location']} | {v['type']} -> Fine ₹{v['fine']} ({v['desc']})")
-        print()
+        timestamp, vehicle_id, location, speed, sig_red, act_pass = evt
+        if speed > _get_threshold(location, _default_threshold):
+            over = speed - _get_limit(location, _default_limit)
+            vids.append(vehicle_id)
+            timestamps.append(timestamp)
+            locations.append(location)
+            flags.append(SPEEDING_FLAG)
+            overs.append(over)
+            fines.append(over * _fine_rate)
+        if sig_red and act_pass:
+            vids.append(vehicle_id)
+            timestamps.append(timestamp)
+            locations.append(location)
+            flags.append(RED_LIGHT_FLAG)
+            overs.append(0)
+            fines.append(RED_LIGHT_FINE)
+    return vids, timestamps, locations, flags, overs, fines
 
-    # Dashboard
-    print("=== Dashboard ===")
-    print(f"Total vehicles with violations: {len(vehicles)}")
-    print(f"Total fines collected: ₹{total_fines}")
-    for k, cnt in overall_counts.items():
-        print(f"  {k}: {cnt}")
-    print("\nPer-vehicle summary:")
-    for vid, data in vehicles.items():
-        print(f"  {vid}: Violations={len(data['violations'])}, TotalFine=₹{data['total_fine']}")
+def main_python(detail=True):
+    # Two flat defaultdicts with C-level factories instead of one
+    # defaultdict(lambda: {...}) paying a Python frame per new vehicle.
+    veh_violations = defaultdict(list)
+    veh_fines = defaultdict(int)
+    overall_counts = defaultdict(int)
+    total_fines = 0
+    saw_data = False
+
+    chunks = _iter_line_chunks()
+    first = next(chunks, None)
+    second = next(chunks, None)
+
+    if second is None:
+        # Input fits in one chunk: process-pool fork cost would dominate.
+        if first is not None:
+            saw_data = not first.isspace()
+            total_fines += _merge_violations(
+                _scan_lines(first), veh_violations, veh_fines, overall_counts)
+    else:
+        # Events are independent until the final per-vehicle merge, so fan
+        # chunks out across cores. The bounded future window keeps memory
+        # at O(workers * chunk) and merging in submit order preserves the
+        # report's chronological ordering.
+        workers = os.cpu_count() or 1
+        in_flight = deque()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for chunk in itertools.chain((first, second), chunks):
+                if not saw_data and not chunk.isspace():
+                    saw_data = True
+                in_flight.append(executor.submit(_scan_lines, chunk))
+                if len(in_flight) >= workers * 2:
+                    total_fines += _merge_violations(
+                        in_flight.popleft().result(),
+                        veh_violations, veh_fines, overall_counts)
+            while in_flight:
+                total_fines += _merge_violations(
+                    in_flight.popleft().result(),
+                    veh_violations, veh_fines, overall_counts)
+
+    if not saw_data:
+        print_sample_input()
+        return
+
+    print_report(veh_violations, veh_fines, overall_counts, total_fines, detail)
+
+def main():
+    # --no-detail: dashboard-only run, skips the per-violation report.
+    detail = "--no-detail" not in sys.argv[1:]
+    if pd is not None:
+        main_vectorized(detail)
+    elif itms_core is not None:
+        main_cython(detail)
+    else:
+        main_python(detail)
 
 if __name__ == '__main__':
     main()
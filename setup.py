@@ -0,0 +1,6 @@
+from setuptools import setup
+from Cython.Build import cythonize
+
+# Optional accelerator for the no-pandas fallback path:
+#     python setup.py build_ext --inplace
+setup(ext_modules=cythonize("itms_core.pyx"))